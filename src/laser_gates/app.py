@@ -12,6 +12,7 @@ import arcade
 from actions import center_window
 
 from .config import WINDOW_HEIGHT, WINDOW_WIDTH
+from .resources import create_rolled_textures
 from .view import Tunnel
 
 
@@ -67,3 +68,5 @@ def run():
         except (AttributeError, RuntimeError):
             # Window might be closed or invalid, ignore cursor restoration errors
             pass
+        # Drop cached rolled textures so their images can be freed with the window
+        create_rolled_textures.cache_clear()
@@ -48,7 +48,7 @@ HILL_SLICES = [
 SHIP = get_resource_path("res/dart.png")
 PLAYER_SHOT = ":resources:/images/space_shooter/laserRed01.png"
 FORCEFIELD = get_resource_path("res/forcefield.png")
-FORCEFIELD_SOLID_COLORS = [
+FORCEFIELD_SOLID_COLORS = (
     (6, 102, 17),
     (57, 23, 1),
     (230, 230, 230),
@@ -75,7 +75,7 @@ FORCEFIELD_SOLID_COLORS = [
     (107, 100, 255),
     (255, 116, 76),
     (97, 89, 236),
-]
+)
 
 # Player ship configuration
 PLAYER_SHIP_VERT = 5
@@ -87,6 +87,7 @@ WALL_WIDTH = 200
 TUNNEL_VELOCITY = -3
 TUNNEL_WALL_HEIGHT = 50
 TUNNEL_WALL_COLOR = (141, 65, 8)
+HILL_SPATIAL_HASH_MIN_SPRITES = 32  # Below this, a brute-force scan beats a spatial hash lookup
 
 # Ship movement bounds
 SHIP_LEFT_BOUND = HILL_WIDTH // 4
@@ -1,5 +1,7 @@
 """Pure game logic functions that can be unit tested without Arcade dependencies."""
 
+from collections.abc import Sequence
+
 from .config import (
     PLAYER_SHIP_FIRE_SPEED,
     PLAYER_SHIP_HORIZ,
@@ -10,6 +12,24 @@ from .config import (
     WINDOW_WIDTH,
 )
 
+# Resolution axis for calculate_hill_collision_mtv, indexed by "x overlap is the smaller one"
+_MTV_AXES = ("y", "x")
+
+# Player input bitmask bits, see input_mask()
+INPUT_LEFT = 0b0001
+INPUT_RIGHT = 0b0010
+INPUT_UP = 0b0100
+INPUT_DOWN = 0b1000
+
+# Velocity for each two-bit (left, right) or (up, down) input pair; opposing keys cancel out
+_HORIZONTAL_VELOCITY_BY_BITS = (0, -PLAYER_SHIP_HORIZ, PLAYER_SHIP_HORIZ, 0)
+_VERTICAL_VELOCITY_BY_BITS = (0, PLAYER_SHIP_VERT, -PLAYER_SHIP_VERT, 0)
+
+
+def input_mask(left: bool, right: bool, up: bool, down: bool) -> int:
+    """Pack the four direction flags into an INPUT_* bitmask."""
+    return left | right << 1 | up << 2 | down << 3
+
 
 def calculate_player_velocity(input_state, current_left_position: float) -> tuple[float, float]:
     """
@@ -17,18 +37,14 @@ def calculate_player_velocity(input_state, current_left_position: float) -> tupl
 
     The input_state object must provide boolean attributes: left, right, up, down.
     """
-    horizontal_velocity = 0
-    vertical_velocity = 0
+    mask = input_mask(input_state.left, input_state.right, input_state.up, input_state.down)
+    return calculate_player_velocity_from_mask(mask, current_left_position)
 
-    if getattr(input_state, "right", False) and not getattr(input_state, "left", False):
-        horizontal_velocity = PLAYER_SHIP_HORIZ
-    elif getattr(input_state, "left", False) and not getattr(input_state, "right", False):
-        horizontal_velocity = -PLAYER_SHIP_HORIZ
 
-    if getattr(input_state, "up", False) and not getattr(input_state, "down", False):
-        vertical_velocity = PLAYER_SHIP_VERT
-    elif getattr(input_state, "down", False) and not getattr(input_state, "up", False):
-        vertical_velocity = -PLAYER_SHIP_VERT
+def calculate_player_velocity_from_mask(mask: int, current_left_position: float) -> tuple[float, float]:
+    """Calculate player velocity from an INPUT_* bitmask and the current position."""
+    horizontal_velocity = _HORIZONTAL_VELOCITY_BY_BITS[mask & 0b11]
+    vertical_velocity = _VERTICAL_VELOCITY_BY_BITS[mask >> 2 & 0b11]
 
     if horizontal_velocity or vertical_velocity:
         # Respect left boundary: no further left when already at edge
@@ -62,10 +78,27 @@ def calculate_hill_collision_mtv(
     if overlap_x <= 0 or overlap_y <= 0:
         return (0, "none")
 
-    if overlap_x < overlap_y:
-        return (overlap_x, "x")
-    else:
-        return (overlap_y, "y")
+    choose_x = overlap_x < overlap_y
+    return ((overlap_y, overlap_x)[choose_x], _MTV_AXES[choose_x])
+
+
+def calculate_min_vertical_overlap(
+    sprite_center_y: float,
+    sprite_height: float,
+    collision_centers_y: Sequence[float],
+    collision_heights: Sequence[float],
+) -> float | None:
+    """Smallest positive vertical overlap between a sprite and a batch of colliders.
+
+    The colliders are given as parallel sequences of center y and height. Returns None when
+    none of them overlap the sprite vertically.
+    """
+    half_height = sprite_height / 2
+    overlaps = (
+        half_height + height / 2 - abs(sprite_center_y - center_y)
+        for center_y, height in zip(collision_centers_y, collision_heights, strict=True)
+    )
+    return min((overlap for overlap in overlaps if overlap > 0), default=None)
 
 
 def get_vertical_push_direction(sprite_center_y: float) -> int:
@@ -81,7 +114,8 @@ def calculate_shot_velocity(direction: int) -> float:
 
 def is_shot_off_screen(shot_left: float, shot_right: float) -> bool:
     """Check if a shot is off screen (fully outside viewport)."""
-    return shot_right < 0 or shot_left > WINDOW_WIDTH
+    # Bitwise | evaluates both comparisons instead of short-circuiting between them
+    return (shot_right < 0) | (shot_left > WINDOW_WIDTH)
 
 
 def should_wave_cleanup_on_completion(sprite_count: int) -> bool:
@@ -33,8 +33,8 @@ class PlayerShip(arcade.Sprite):
         self.direction = self.RIGHT
         self.behaviour = behaviour  # Optional AI/attract mode behaviour
 
-        # Input state for velocity provider
-        self._input = {"left": False, "right": False, "up": False, "down": False}
+        # Input state for velocity provider, as a logic.INPUT_* bitmask
+        self._input_mask = 0
 
         # Create the initial movement action
         self._create_movement_action()
@@ -44,13 +44,7 @@ class PlayerShip(arcade.Sprite):
 
         def velocity_provider():
             # Delegate velocity decision to pure logic function
-            class _Input:
-                left = self._input["left"]
-                right = self._input["right"]
-                up = self._input["up"]
-                down = self._input["down"]
-
-            return logic.calculate_player_velocity(_Input, self.left)
+            return logic.calculate_player_velocity_from_mask(self._input_mask, self.left)
 
         def on_boundary_enter(sprite, axis, side):
             if axis == "x" and side == "right":
@@ -77,7 +71,7 @@ class PlayerShip(arcade.Sprite):
 
     def move(self, left_pressed, right_pressed, up_pressed, down_pressed):
         # Simply update input state - velocity_provider handles the rest
-        self._input.update(left=left_pressed, right=right_pressed, up=up_pressed, down=down_pressed)
+        self._input_mask = logic.input_mask(left_pressed, right_pressed, up_pressed, down_pressed)
 
         # Update direction and texture for visual feedback
         if right_pressed and not left_pressed:
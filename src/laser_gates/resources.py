@@ -1,5 +1,6 @@
 """Resource management for textures and sprite pools."""
 
+import functools
 from collections.abc import Callable, Iterable
 
 import arcade
@@ -8,6 +9,12 @@ import arcade
 class TextureCache(dict):
     """A cache for arcade textures that loads them only once per path."""
 
+    def __missing__(self, path: str) -> arcade.Texture:
+        """Load and cache a texture the first time its path is looked up."""
+        texture = arcade.load_texture(path)
+        self[path] = texture
+        return texture
+
     def get(self, path: str) -> arcade.Texture:
         """Get a texture from the cache, loading it if necessary.
 
@@ -17,32 +24,42 @@ class TextureCache(dict):
         Returns:
             The cached or newly loaded texture
         """
-        texture = super().get(path)
-        if texture is None:
-            texture = arcade.load_texture(path)
-            self[path] = texture
-        return texture
+        # A hit is a single dict lookup; misses fall through to __missing__
+        return self[path]
 
 
 class SpritePool:
     """A pool of sprites that can be acquired and released to avoid allocation during gameplay."""
 
-    def __init__(self, factory: Callable[[], arcade.Sprite], size: int):
+    def __init__(self, factory: Callable[[], arcade.Sprite], size: int, use_spatial_hash: bool = True):
         """Initialize the sprite pool.
 
         Args:
             factory: Function that creates a new sprite
             size: Number of sprites to pre-allocate
+            use_spatial_hash: Whether the active list keeps a spatial hash. Every move of an active
+                sprite updates the hash, so disable it when nothing collides against the active list.
         """
         self._factory = factory
-        self.active = arcade.SpriteList(use_spatial_hash=True)
-        self.inactive = arcade.SpriteList()
+        # Size both lists for the whole pool up front so filling them never grows their buffers
+        self.active = arcade.SpriteList(use_spatial_hash=use_spatial_hash, capacity=size)
+        self.inactive = arcade.SpriteList(capacity=size)
 
         # Pre-allocate all sprites
         for _ in range(size):
             sprite = factory()
             self.inactive.append(sprite)
 
+    @property
+    def active_count(self) -> int:
+        """Number of sprites currently acquired."""
+        return len(self.active)
+
+    @property
+    def inactive_count(self) -> int:
+        """Number of sprites available to acquire."""
+        return len(self.inactive)
+
     def acquire(self, n: int) -> arcade.SpriteList:
         """Acquire n sprites from the pool.
 
@@ -58,10 +75,11 @@ class SpritePool:
         if n > len(self.inactive):
             raise RuntimeError(f"pool exhausted: requested {n}, available {len(self.inactive)}")
 
-        # Move sprites from inactive to active
-        sprites = arcade.SpriteList()
+        # Move sprites from inactive to active, popping from the tail: SpriteList.pop() is O(1)
+        # there, while pop(0) shifts every remaining sprite and its index entry
+        sprites = arcade.SpriteList(capacity=n)
         for _ in range(n):
-            sprite = self.inactive.pop(0)
+            sprite = self.inactive.pop()
             self.active.append(sprite)
             sprites.append(sprite)
 
@@ -73,7 +91,11 @@ class SpritePool:
         Args:
             sprites: Iterable of sprites to release
         """
-        sprites_to_release = list(sprites) if sprites is self.active else sprites
+        sprites_to_release = sprites
+        if sprites is self.active:
+            # Releasing the whole active list: one clear() replaces a linear remove() per sprite
+            sprites_to_release = list(sprites)
+            self.active.clear()
 
         for sprite in sprites_to_release:
             sprite.visible = False
@@ -85,21 +107,21 @@ class SpritePool:
 
     def release_all(self) -> None:
         """Release all active sprites back to the pool."""
-        # Move all sprites from active to inactive efficiently
-        while self.active:
-            sprite = self.active.pop()
-            sprite.visible = False
-            sprite.remove_from_sprite_lists()
-            self.inactive.append(sprite)
+        # Releasing the active list itself empties it with a single clear()
+        self.release(self.active)
 
 
 # Global texture cache
 TEXTURES = TextureCache()
 
 
+@functools.lru_cache(maxsize=64)
 def create_rolled_textures(base_texture: arcade.Texture, num_frames: int = None) -> list[arcade.Texture]:
     """Create a list of textures where each is rolled down by 1 pixel from the previous.
 
+    Results are cached per (texture, num_frames), so every caller shares the same list;
+    callers must not mutate it.
+
     Args:
         base_texture: The original texture to create rolled versions from
         num_frames: Number of rolled textures to create. If None, creates one for each pixel row
@@ -112,23 +134,24 @@ def create_rolled_textures(base_texture: arcade.Texture, num_frames: int = None)
     if num_frames is None:
         num_frames = base_texture.height
 
-    # Get the image data from the base texture
+    # Get the raw pixel data from the base texture once; rows are stored top to bottom
     image = base_texture.image
-    width, height = image.size
+    height = image.height
+    data = image.tobytes()
+    frame_bytes = len(data)
+    row_bytes = frame_bytes // height
+
+    # Every rolled frame is a contiguous window into the image stacked on itself, so all frames
+    # can share this one buffer. frombuffer maps it read-only instead of copying per frame.
+    doubled = memoryview(data + data)
 
     frames = []
 
     for y_offset in range(num_frames):
-        # Create a new image with the same size and mode
-        new_image = Image.new(image.mode, (width, height))
-
-        # Roll the image down by y_offset pixels
-        for y in range(height):
-            source_y = (y + y_offset) % height
-            # Copy the entire row
-            for x in range(width):
-                pixel = image.getpixel((x, source_y))
-                new_image.putpixel((x, y), pixel)
+        # Roll the image by y_offset rows: start the window y_offset rows into the doubled buffer
+        split = (y_offset % height) * row_bytes
+        window = doubled[split : split + frame_bytes]
+        new_image = Image.frombuffer(image.mode, image.size, window, "raw", image.mode, 0, 1)
 
         # Create a new texture from the rolled image
         tex = arcade.Texture(new_image, hash=f"rolled_{y_offset}")
@@ -4,7 +4,8 @@ from collections.abc import Callable
 
 import arcade
 
-from .config import TUNNEL_WALL_COLOR, TUNNEL_WALL_HEIGHT, WINDOW_HEIGHT, WINDOW_WIDTH
+from .config import HILL_SPATIAL_HASH_MIN_SPRITES, TUNNEL_WALL_COLOR, TUNNEL_WALL_HEIGHT, WINDOW_HEIGHT, WINDOW_WIDTH
+from .logic import calculate_min_vertical_overlap
 
 
 def create_tunnel_wall(left, top):
@@ -29,49 +30,27 @@ def create_sprite_at_location(file_or_texture, **kwargs):
 
 def handle_hill_collision(sprite, collision_lists, register_damage: Callable[[float], None]):
     """Handle collision with hills by adjusting position and providing visual feedback."""
-    # Use CPU-based collision to avoid requiring an active window/context in headless tests
-    collision_hit = arcade.check_for_collision_with_lists(sprite, collision_lists, method=3)
+    # Use CPU-based collision to avoid requiring an active window/context in headless tests.
+    # Large hashed lists only test the sprites sharing the player's hash cells.
+    collision_hit = []
+    for collision_list in collision_lists:
+        use_hash = collision_list.spatial_hash is not None and len(collision_list) >= HILL_SPATIAL_HASH_MIN_SPRITES
+        collision_hit.extend(arcade.check_for_collision_with_list(sprite, collision_list, method=1 if use_hash else 3))
     if not collision_hit:
         return False
 
-    # Compute minimum translation vector to resolve all overlaps
-    min_overlap = None
-    mtv_axis = None  # "x" or "y"
-
-    for collision_sprite in collision_hit:
-        dx = sprite.center_x - collision_sprite.center_x
-        dy = sprite.center_y - collision_sprite.center_y
-
-        overlap_x = (sprite.width / 2 + collision_sprite.width / 2) - abs(dx)
-        overlap_y = (sprite.height / 2 + collision_sprite.height / 2) - abs(dy)
-
-        # Skip if somehow not overlapping (shouldn't happen given collision detection)
-        if overlap_x <= 0 or overlap_y <= 0:
-            continue
-
-        # Choose axis with smaller overlap to resolve
-        if overlap_x < overlap_y:
-            if min_overlap is None or overlap_x < min_overlap:
-                min_overlap = overlap_x
-                mtv_axis = ("x", 1 if dx > 0 else -1)
-        else:
-            if min_overlap is None or overlap_y < min_overlap:
-                min_overlap = overlap_y
-                mtv_axis = ("y", 1 if dy > 0 else -1)
-
     # Always push vertically away from screen center
     # Determine direction: up (1) if in bottom half, down (-1) if in top half
     screen_mid = WINDOW_HEIGHT / 2
     vertical_dir = 1 if sprite.center_y < screen_mid else -1
 
     # Determine minimal vertical overlap among collisions to move the sprite out
-    min_vertical_overlap = None
-    for collision_sprite in collision_hit:
-        dy = sprite.center_y - collision_sprite.center_y
-        overlap_y = (sprite.height / 2 + collision_sprite.height / 2) - abs(dy)
-        if overlap_y > 0:
-            if min_vertical_overlap is None or overlap_y < min_vertical_overlap:
-                min_vertical_overlap = overlap_y
+    min_vertical_overlap = calculate_min_vertical_overlap(
+        sprite.center_y,
+        sprite.height,
+        [hit.center_y for hit in collision_hit],
+        [hit.height for hit in collision_hit],
+    )
 
     # Fallback small nudge if calculation failed (shouldn't happen)
     if min_vertical_overlap is None:
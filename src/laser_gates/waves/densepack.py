@@ -16,6 +16,8 @@ from .wave_base import EnemyWave
 
 
 class _DensePackWave(EnemyWave):
+    __slots__ = ("_width", "_shield_pool", "_shield_sprites")
+
     def __init__(self, wall_width: int):
         super().__init__()
 
@@ -24,7 +26,9 @@ class _DensePackWave(EnemyWave):
             return arcade.SpriteSolidColor(10, 12, color=arcade.color.GRAY)
 
         self._width = wall_width
-        self._shield_pool = SpritePool(make_shield_block, size=300)  # 10 width * 30 height = 300 max
+        # 10 width * 30 height = 300 max. Collisions are checked against the acquired list, never
+        # the pool's active list, so it skips the spatial hash that would re-bucket every moving block.
+        self._shield_pool = SpritePool(make_shield_block, size=300, use_spatial_hash=False)
         self._shield_sprites = arcade.SpriteList()
 
     def build(self, ctx: WaveContext) -> arcade.SpriteList:
@@ -80,14 +84,17 @@ class _DensePackWave(EnemyWave):
             return
         self._shield_sprites.update()
         # Shot collisions
+        hit_shots = []
         destroyed_blocks = []
-        for shot in tuple(ctx.shot_list):
+        for shot in ctx.shot_list:
             hits = arcade.check_for_collision_with_list(shot, self._shield_sprites)
             if hits:
-                shot.remove_from_sprite_lists()  # remove shot immediately
+                hit_shots.append(shot)
                 destroyed_blocks.extend(hits)  # defer block cleanup to pool
 
-        # Release destroyed blocks back to the pool
+        # Remove hit shots and release destroyed blocks back to the pool
+        for shot in hit_shots:
+            shot.remove_from_sprite_lists()
         if destroyed_blocks:
             self._shield_pool.release(destroyed_blocks)
 
@@ -102,14 +109,19 @@ class _DensePackWave(EnemyWave):
         for action in self._actions:
             action.stop()
         self._actions.clear()
+        self._scroll_actions.clear()
         self._shield_pool.release_all()
 
 
 class ThinDensePackWave(_DensePackWave):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(wall_width=5)
 
 
 class ThickDensePackWave(_DensePackWave):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(wall_width=10)
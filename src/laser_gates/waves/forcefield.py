@@ -1,15 +1,21 @@
-"""Forcefield wave implementations."""
+"""Forcefield wave implementations.
+
+Waves take the narrow-phase collision function as a constructor argument, so tests can hand in
+a plain function instead of patching ``arcade``.
+"""
+
+import itertools
+from collections.abc import Callable, Iterator
 
 import arcade
 from actions import (
+    Action,
     BlinkUntil,
     CallbackUntil,
     MoveUntil,
     MoveXUntil,
     MoveYUntil,
-    cycle_textures_until,
     infinite,
-    parallel,
 )
 
 from .. import resources
@@ -26,10 +32,86 @@ from ..config import (
 from ..contexts import WaveContext
 from .wave_base import EnemyWave
 
+_EMPTY_SPRITELIST: arcade.SpriteList | None = None
+
+# Mid-bar texture animation speed, in texture frames per second
+_MID_TEXTURES_PER_SECOND = 100
+
+# Scroll bounds for the flashing wave's last slice: cleanup fires once it passes the left edge
+_FLASHING_SCROLL_BOUNDS = (-WALL_WIDTH, 0, WINDOW_WIDTH + WALL_WIDTH + WALL_WIDTH, WINDOW_HEIGHT)
+
+
+def _empty_spritelist() -> arcade.SpriteList:
+    """Return the shared empty SpriteList that forcefield waves hand back from build().
+
+    Forcefield waves draw their own sprite lists, so callers only ever get this placeholder.
+    It is created lazily so no SpriteList exists before the window does, and must never be
+    appended to.
+    """
+    global _EMPTY_SPRITELIST
+    if _EMPTY_SPRITELIST is None:
+        _EMPTY_SPRITELIST = arcade.SpriteList()
+    return _EMPTY_SPRITELIST
+
+
+class _RollMidTextures(Action):
+    """Roll the mid-bar textures from one cursor: top bars scroll backwards, bottom bars forwards.
+
+    The cursor advances by elapsed time and the action factor, so the animation keeps its rate
+    when frames drop.
+    """
+
+    def __init__(
+        self,
+        textures: list[arcade.Texture],
+        top_mid_forcefields: arcade.SpriteList,
+        bottom_mid_forcefields: arcade.SpriteList,
+    ):
+        super().__init__(condition=infinite)
+        self._textures = textures
+        self._top_mid_forcefields = top_mid_forcefields
+        self._bottom_mid_forcefields = bottom_mid_forcefields
+        self._cursor = 0.0
+
+    def update_effect(self, delta_time: float) -> None:
+        textures = self._textures
+        count = len(textures)
+        self._cursor = (self._cursor + _MID_TEXTURES_PER_SECOND * delta_time * self._factor) % count
+        frame = int(self._cursor)
+        top_texture = textures[-frame % count]
+        bottom_texture = textures[frame]
+        for sprite in self._top_mid_forcefields:
+            sprite.texture = top_texture
+        for sprite in self._bottom_mid_forcefields:
+            sprite.texture = bottom_texture
+
+    def clone(self) -> "_RollMidTextures":
+        return _RollMidTextures(self._textures, self._top_mid_forcefields, self._bottom_mid_forcefields)
+
 
 class ForcefieldWave(EnemyWave):
-    def __init__(self, total_forcefields):
+    __slots__ = (
+        "_total_forcefields",
+        "_forcefield_spacing",
+        "_forcefield_textures",
+        "_top_forcefields",
+        "_bottom_forcefields",
+        "_top_mid_forcefields",
+        "_bottom_mid_forcefields",
+        "_initial_forcefields",
+        "_last_forcefield",
+        "_all_forcefields",
+        "_color_cycle",
+        "_span_width",
+        "_start_positions",
+        "_collide",
+        "_collision_phase",
+        "_collision_fn",
+    )
+
+    def __init__(self, total_forcefields, collision_fn: Callable[..., list] | None = None):
         super().__init__()
+        self._collision_fn = collision_fn or arcade.check_for_collision_with_list
         self._total_forcefields = total_forcefields
         self._forcefield_spacing = 220
         self._forcefield_textures = resources.create_forcefield_textures(FORCEFIELD)
@@ -38,14 +120,20 @@ class ForcefieldWave(EnemyWave):
         self._top_mid_forcefields = arcade.SpriteList()
         self._bottom_mid_forcefields = arcade.SpriteList()
         for _ in range(self._total_forcefields):
-            self._top_forcefields.append(arcade.SpriteSolidColor(53, HILL_HEIGHT, color=FORCEFIELD_SOLID_COLORS[0]))
-            self._bottom_forcefields.append(arcade.SpriteSolidColor(53, HILL_HEIGHT, color=FORCEFIELD_SOLID_COLORS[0]))
+            # Solid bars stay white; their list's multiply color supplies the flashing palette
+            self._top_forcefields.append(arcade.SpriteSolidColor(53, HILL_HEIGHT, color=arcade.color.WHITE))
+            self._bottom_forcefields.append(arcade.SpriteSolidColor(53, HILL_HEIGHT, color=arcade.color.WHITE))
             self._top_mid_forcefields.append(arcade.Sprite(FORCEFIELD, scale=(1.5, 1)))
             self._bottom_mid_forcefields.append(arcade.Sprite(FORCEFIELD, scale=(1.5, 1)))
+        self._top_forcefields.color = FORCEFIELD_SOLID_COLORS[0]
+        self._bottom_forcefields.color = FORCEFIELD_SOLID_COLORS[0]
         self._initial_forcefields = arcade.SpriteList()
         self._last_forcefield = arcade.SpriteList()
-        self._current_color_index = 0
-        self._num_forcefield_colors = len(FORCEFIELD_SOLID_COLORS)
+        # Union of every bar, used only for collision queries so each shot needs a single lookup.
+        # It is not spatially hashed: every bar moves every frame, so a hash would re-bucket all of
+        # them for the one or two queries the span check lets through.
+        self._all_forcefields = arcade.SpriteList()
+        self._color_cycle = self._new_color_cycle()
         for i in range(self._total_forcefields - 1):
             self._initial_forcefields.append(self._top_forcefields[i])
             self._initial_forcefields.append(self._top_mid_forcefields[i])
@@ -55,46 +143,130 @@ class ForcefieldWave(EnemyWave):
         self._last_forcefield.append(self._top_mid_forcefields[self._total_forcefields - 1])
         self._last_forcefield.append(self._bottom_mid_forcefields[self._total_forcefields - 1])
         self._last_forcefield.append(self._bottom_forcefields[self._total_forcefields - 1])
+        self._all_forcefields.extend(self._initial_forcefields)
+        self._all_forcefields.extend(self._last_forcefield)
+        # Every bar in a slice shares its left edge and all slices scroll together, so the
+        # horizontal extent of the whole wave is a fixed width measured from the first slice.
+        self._span_width = (self._total_forcefields - 1) * self._forcefield_spacing + max(
+            self._top_forcefields[0].width, self._top_mid_forcefields[0].width
+        )
+        # The layout never changes, so build() only has to copy these back onto the sprites
+        self._start_positions = self._compute_start_positions()
+        self._forcefields_active = False  # Track whether forcefields are currently active for collisions
+        self._collision_phase = 0
+
+    @property
+    def _forcefields_active(self) -> bool:
+        return self._collide == self._check_collisions
+
+    @_forcefields_active.setter
+    def _forcefields_active(self, active: bool) -> None:
+        # Swap the per-frame collision step instead of branching on a flag in update()
+        self._collide = self._check_collisions if active else self._skip_collisions
+
+    def update(self, ctx: WaveContext) -> None:
+        """Per-frame logic (collision tests, win/loss checks)."""
+        # Handle collisions between player shots and the forcefields
+        if not self._last_forcefield:
+            return
+        self._initial_forcefields.update()
+        self._last_forcefield.update()
+        # Even at double speed a shot closes on the bars by ~21 px a frame, so two frames of travel
+        # stay under a bar's 53 px width and sweeping every other frame can't let a shot slip
+        # through. The first frame after build always sweeps.
+        self._collision_phase ^= 1
+        if self._collision_phase:
+            self._collide(ctx)
+
+    def _skip_collisions(self, ctx: WaveContext) -> None:
+        """Collision step while the forcefields are inactive: nothing can hit them."""
+
+    def _check_collisions(self, ctx: WaveContext) -> None:
+        """Collision step while the forcefields are active."""
+        # Broad phase: sprites outside the bars' shared x-extent can't hit any of them
+        span_left, span_right = self._forcefield_span()
+
+        # Shot collisions
+        shots = ctx.shot_list
+        if shots:
+            hit_shots = [
+                shot
+                for shot in shots
+                if shot.right >= span_left
+                and shot.left <= span_right
+                and self._collision_fn(shot, self._all_forcefields, method=3)
+            ]
+            for shot in hit_shots:
+                shot.remove_from_sprite_lists()
+
+        # Player collisions
+        player = ctx.player_ship
+        if (
+            player.right >= span_left
+            and player.left <= span_right
+            and self._collision_fn(player, self._all_forcefields, method=3)
+        ):
+            ctx.register_damage(1.0)
+            ctx.on_cleanup(self)
 
     def cleanup(self, ctx: WaveContext) -> None:
+        self._forcefields_active = False
+        self._collision_phase = 0
         for action in self._actions:
             action.stop()
         self._initial_forcefields.visible = False
         self._last_forcefield.visible = False
-        self._current_color_index = 0
+        self._all_forcefields.visible = False
+        self._color_cycle = self._new_color_cycle()
         self._actions.clear()
+        self._scroll_actions.clear()
 
-    def _update_color(self):
-        self._current_color_index = (self._current_color_index + 1) % self._num_forcefield_colors
-        for i in range(self._total_forcefields):
-            self._top_forcefields[i].color = FORCEFIELD_SOLID_COLORS[self._current_color_index]
-            self._bottom_forcefields[i].color = FORCEFIELD_SOLID_COLORS[self._current_color_index]
-
-    def _position_forcefield(self, i: int):
-        self._bottom_forcefields[i].left = WINDOW_WIDTH + WALL_WIDTH + i * self._forcefield_spacing
-        self._bottom_forcefields[i].bottom = TUNNEL_WALL_HEIGHT
-        self._bottom_mid_forcefields[i].left = WINDOW_WIDTH + WALL_WIDTH + i * self._forcefield_spacing
-        self._bottom_mid_forcefields[i].bottom = TUNNEL_WALL_HEIGHT + HILL_HEIGHT
-        self._top_mid_forcefields[i].left = WINDOW_WIDTH + WALL_WIDTH + i * self._forcefield_spacing
-        self._top_mid_forcefields[i].bottom = TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109
-        self._top_forcefields[i].left = WINDOW_WIDTH + WALL_WIDTH + i * self._forcefield_spacing
-        self._top_forcefields[i].bottom = TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109 * 2
-
-    def _create_move_action(self, i: int, vel: int, ctx: WaveContext) -> MoveUntil:
-        if i < self._total_forcefields - 1:
-            return MoveUntil(velocity=(vel, 0), condition=infinite)
-        return MoveUntil(
-            velocity=(vel, 0),
-            condition=infinite,
-            bounds=(
-                -WALL_WIDTH,
-                0,
-                WINDOW_WIDTH + WALL_WIDTH + WALL_WIDTH,
-                WINDOW_HEIGHT,
-            ),
-            boundary_behavior="limit",
-            on_boundary_enter=lambda sprite, axis, side: ctx.on_cleanup(self),
+    def add_draw_order(self) -> list[tuple[int, arcade.SpriteList]]:
+        return [
+            (5, self._top_forcefields),
+            (6, self._bottom_forcefields),
+            (7, self._top_mid_forcefields),
+            (8, self._bottom_mid_forcefields),
+        ]
+
+    def _forcefield_span(self) -> tuple[float, float]:
+        """Horizontal extent (left, right) covered by all forcefield bars this frame."""
+        span_left = self._bottom_forcefields[0].left
+        return span_left, span_left + self._span_width
+
+    @staticmethod
+    def _new_color_cycle() -> Iterator[tuple[int, int, int]]:
+        """Endless solid-color sequence, starting after the color the bars are created with."""
+        return itertools.islice(itertools.cycle(FORCEFIELD_SOLID_COLORS), 1, None)
+
+    def _update_color(self, _sprites: arcade.SpriteList) -> None:
+        # SpriteList.color is applied at draw time, so this is O(1) regardless of bar count
+        color = next(self._color_cycle)
+        self._top_forcefields.color = color
+        self._bottom_forcefields.color = color
+
+    def _compute_start_positions(self) -> list[tuple[arcade.Sprite, tuple[float, float]]]:
+        """Pair every bar with its starting center, just past the right edge of the screen."""
+        # Bars are opaque rectangles, so left/bottom are center minus half the size
+        rows = (
+            (self._bottom_forcefields, TUNNEL_WALL_HEIGHT),
+            (self._bottom_mid_forcefields, TUNNEL_WALL_HEIGHT + HILL_HEIGHT),
+            (self._top_mid_forcefields, TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109),
+            (self._top_forcefields, TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109 * 2),
         )
+        spacing = self._forcefield_spacing
+        positions = []
+        for sprites, bottom in rows:
+            x = WINDOW_WIDTH + WALL_WIDTH
+            for sprite in sprites:
+                positions.append((sprite, (x + sprite.width / 2, bottom + sprite.height / 2)))
+                x += spacing
+        return positions
+
+    def _position_forcefields(self) -> None:
+        """Move every bar back to its starting slot just past the right edge of the screen."""
+        for sprite, position in self._start_positions:
+            sprite.position = position
 
     def _add_color_update_callback(self) -> None:
         call_action = CallbackUntil(
@@ -106,28 +278,16 @@ class ForcefieldWave(EnemyWave):
         self._actions.append(call_action)
 
     def _add_middle_animation_actions(self) -> None:
-        cycle_top = cycle_textures_until(
-            self._top_mid_forcefields,
-            textures=self._forcefield_textures,
-            frames_per_second=100,
-            direction=-1,
-            condition=infinite,
-        )
-        self._actions.append(cycle_top)
-        cycle_bottom = cycle_textures_until(
-            self._bottom_mid_forcefields,
-            textures=self._forcefield_textures,
-            frames_per_second=100,
-            direction=1,
-            condition=infinite,
+        # One action animates both mid-bar lists from a shared texture cursor
+        animate_action = _RollMidTextures(
+            self._forcefield_textures, self._top_mid_forcefields, self._bottom_mid_forcefields
         )
-        self._actions.append(cycle_bottom)
+        animate_action.apply(self._top_mid_forcefields)
+        self._actions.append(animate_action)
 
 
 class FlashingForcefieldWave(ForcefieldWave):
-    def __init__(self, total_forcefields):
-        super().__init__(total_forcefields)
-        self._forcefields_active = False  # Track whether forcefields are currently active for collisions
+    __slots__ = ()
 
     def _forcefields_on(self, spritelist: arcade.SpriteList):
         self._forcefields_active = True
@@ -135,78 +295,73 @@ class FlashingForcefieldWave(ForcefieldWave):
     def _forcefields_off(self, spritelist: arcade.SpriteList):
         self._forcefields_active = False
 
-    def _setup_forcefield_action(self, i: int, vel: int, ctx: WaveContext):
-        move_action = self._create_move_action(i, vel, ctx)
+    def _add_scroll_action(self, forcefields: arcade.SpriteList, move_action: MoveUntil) -> None:
+        move_action.apply(forcefields)
+        self._actions.append(move_action)
+        self._scroll_actions.append(move_action)  # Track scroll action for velocity updates
 
+    def _create_last_move_action(self, vel: int, ctx: WaveContext) -> MoveUntil:
+        """Scroll for the last slice, which cleans up the wave once it leaves the screen."""
+        return MoveUntil(
+            velocity=(vel, 0),
+            condition=infinite,
+            bounds=_FLASHING_SCROLL_BOUNDS,
+            boundary_behavior="limit",
+            on_boundary_enter=lambda sprite, axis, side: ctx.on_cleanup(self),
+        )
+
+    def _add_blink_action(self) -> None:
+        # One blink timer drives every bar, so the on/off callbacks fire once per blink edge
         blink_action = BlinkUntil(
             seconds_until_change=0.5,
             condition=infinite,
             on_blink_enter=self._forcefields_on,
             on_blink_exit=self._forcefields_off,
         )
-        combined_actions = parallel(move_action, blink_action)
-        if i < self._total_forcefields - 1:
-            combined_actions.apply(self._initial_forcefields)
-        else:
-            combined_actions.apply(self._last_forcefield)
-        self._actions.append(combined_actions)
-        self._scroll_actions.append(move_action)  # Track scroll action for velocity updates
-        if i == self._total_forcefields - 1:
-            self._add_color_update_callback()
-            self._add_middle_animation_actions()
+        blink_action.apply(self._all_forcefields)
+        self._actions.append(blink_action)
 
     def build(self, ctx: WaveContext) -> arcade.SpriteList:
         """Populate enemy sprites and add actions (move_until, etc.)."""
         current_velocity = TUNNEL_VELOCITY * ctx.player_ship.speed_factor
 
-        for i in range(self._total_forcefields):
-            self._position_forcefield(i)
-        for i in range(self._total_forcefields - 2, self._total_forcefields):
-            self._setup_forcefield_action(i, current_velocity, ctx)
+        self._position_forcefields()
+        self._add_scroll_action(
+            self._initial_forcefields, MoveUntil(velocity=(current_velocity, 0), condition=infinite)
+        )
+        self._add_scroll_action(self._last_forcefield, self._create_last_move_action(current_velocity, ctx))
+        self._add_blink_action()
+        self._add_color_update_callback()
+        self._add_middle_animation_actions()
 
         self._initial_forcefields.visible = True
         self._last_forcefield.visible = True
+        self._all_forcefields.visible = True
         self._forcefields_active = True
 
-        return arcade.SpriteList()  # Forcefield waves manage their own sprite lists
-
-    def add_draw_order(self) -> list[tuple[int, arcade.SpriteList]]:
-        return [(5, self._initial_forcefields), (6, self._last_forcefield)]
-
-    def update(self, ctx: WaveContext) -> None:
-        """Per-frame logic (collision tests, win/loss checks)."""
-        # Handle collisions between player shots and the forcefields
-        if not self._last_forcefield:
-            return
-        self._initial_forcefields.update()
-        self._last_forcefield.update()
-
-        # Shot collisions - only check when forcefields are active
-        if self._forcefields_active:
-            for shot in tuple(ctx.shot_list):
-                hits = arcade.check_for_collision_with_list(
-                    shot, self._initial_forcefields
-                ) or arcade.check_for_collision_with_list(shot, self._last_forcefield)
-                if hits:
-                    shot.remove_from_sprite_lists()  # remove shot immediately
-
-        # Player collisions - only check when forcefields are active
-        if self._forcefields_active and (
-            arcade.check_for_collision_with_list(ctx.player_ship, self._initial_forcefields)
-            or arcade.check_for_collision_with_list(ctx.player_ship, self._last_forcefield)
-        ):
-            ctx.register_damage(1.0)
-            ctx.on_cleanup(self)
-            return
-
-    def cleanup(self, ctx: WaveContext) -> None:
-        self._forcefields_active = False
-        super().cleanup(ctx)
+        return _empty_spritelist()  # Forcefield waves manage their own sprite lists
 
 
 class FlexingForcefieldWave(ForcefieldWave):
-    def __init__(self, total_forcefields):
-        super().__init__(total_forcefields)
+    __slots__ = ("_scroll_bounds", "_top_bounce_bounds", "_bottom_bounce_bounds")
+
+    def __init__(self, total_forcefields, collision_fn: Callable[..., list] | None = None):
+        super().__init__(total_forcefields, collision_fn)
+        # Action bounds depend only on the wave layout, so build them once here
+        x_bound_right = WINDOW_WIDTH + WALL_WIDTH + self._forcefield_spacing * self._total_forcefields
+        self._scroll_bounds = (-WALL_WIDTH, 0, x_bound_right, WINDOW_HEIGHT)
+        self._top_bounce_bounds = (
+            -WALL_WIDTH,
+            TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109 + 109 / 2,
+            x_bound_right,
+            TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109 * 2 + 109 / 2,
+        )
+        self._bottom_bounce_bounds = (
+            -WALL_WIDTH,
+            TUNNEL_WALL_HEIGHT + HILL_HEIGHT - 109 / 2,
+            x_bound_right,
+            TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109 / 2,
+        )
 
     def _setup_forcefield_action(self, i: int, vel: int, ctx: WaveContext):
         # Horizontal scroll (all four bars in this slice)
@@ -221,12 +376,7 @@ class FlexingForcefieldWave(ForcefieldWave):
         scroll_x = MoveXUntil(
             velocity=(vel, 0),  # vel is already negative
             condition=infinite,
-            bounds=(
-                -WALL_WIDTH,
-                0,
-                WINDOW_WIDTH + WALL_WIDTH + self._forcefield_spacing * self._total_forcefields,
-                WINDOW_HEIGHT,
-            ),
+            bounds=self._scroll_bounds,
             boundary_behavior="limit",
             on_boundary_enter=on_boundary_callback,
         )
@@ -243,12 +393,7 @@ class FlexingForcefieldWave(ForcefieldWave):
             bounce_top = MoveYUntil(
                 velocity=(0, -2),
                 condition=infinite,
-                bounds=(
-                    -WALL_WIDTH,
-                    TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109 + 109 / 2,
-                    WINDOW_WIDTH + WALL_WIDTH + self._forcefield_spacing * self._total_forcefields,
-                    TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109 * 2 + 109 / 2,
-                ),
+                bounds=self._top_bounce_bounds,
                 boundary_behavior="bounce",
             )
             bounce_top.apply(self._top_mid_forcefields)
@@ -256,12 +401,7 @@ class FlexingForcefieldWave(ForcefieldWave):
             bounce_bottom = MoveYUntil(
                 velocity=(0, 2),
                 condition=infinite,
-                bounds=(
-                    -WALL_WIDTH,
-                    TUNNEL_WALL_HEIGHT + HILL_HEIGHT - 109 / 2,
-                    WINDOW_WIDTH + WALL_WIDTH + self._forcefield_spacing * self._total_forcefields,
-                    TUNNEL_WALL_HEIGHT + HILL_HEIGHT + 109 / 2,
-                ),
+                bounds=self._bottom_bounce_bounds,
                 boundary_behavior="bounce",
             )
             bounce_bottom.apply(self._bottom_mid_forcefields)
@@ -273,52 +413,13 @@ class FlexingForcefieldWave(ForcefieldWave):
     def build(self, ctx: WaveContext) -> arcade.SpriteList:
         """Populate enemy sprites and add actions (move_until, etc.)."""
         current_velocity = TUNNEL_VELOCITY * ctx.player_ship.speed_factor
-        for i in range(self._total_forcefields):
-            self._position_forcefield(i)
+        self._position_forcefields()
         for i in range(self._total_forcefields - 2, self._total_forcefields):
             self._setup_forcefield_action(i, current_velocity, ctx)
 
         self._initial_forcefields.visible = True
         self._last_forcefield.visible = True
+        self._all_forcefields.visible = True
+        self._forcefields_active = True  # Flexing forcefields never switch off
 
-        return arcade.SpriteList()  # Forcefield waves manage their own sprite lists
-
-    def add_draw_order(self) -> list[tuple[int, arcade.SpriteList]]:
-        return [
-            (5, self._top_forcefields),
-            (6, self._bottom_forcefields),
-            (7, self._top_mid_forcefields),
-            (8, self._bottom_mid_forcefields),
-        ]
-
-    def update(self, ctx: WaveContext) -> None:
-        """Per-frame logic (collision tests, win/loss checks)."""
-        # Handle collisions between player shots and the forcefields
-        if not self._last_forcefield:
-            return
-        self._initial_forcefields.update()
-        self._last_forcefield.update()
-
-        # Shot collisions
-        for shot in tuple(ctx.shot_list):
-            hits = arcade.check_for_collision_with_list(
-                shot, self._initial_forcefields
-            ) or arcade.check_for_collision_with_list(shot, self._last_forcefield)
-            if hits:
-                shot.remove_from_sprite_lists()  # remove shot immediately
-
-        # Player collisions
-        if arcade.check_for_collision_with_list(
-            ctx.player_ship, self._initial_forcefields
-        ) or arcade.check_for_collision_with_list(ctx.player_ship, self._last_forcefield):
-            ctx.register_damage(1.0)
-            ctx.on_cleanup(self)
-            return
-
-    def cleanup(self, ctx: WaveContext) -> None:
-        for action in self._actions:
-            action.stop()
-        self._initial_forcefields.visible = False
-        self._last_forcefield.visible = False
-        self._current_color_index = 0
-        self._actions.clear()
+        return _empty_spritelist()  # Forcefield waves manage their own sprite lists
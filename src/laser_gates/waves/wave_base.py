@@ -15,6 +15,8 @@ class EnemyWave(ABC):
     A wave owns NO sprites—it receives the SpriteList that Tunnel created.
     """
 
+    __slots__ = ("_actions", "_scroll_actions")
+
     def __init__(self):
         self._actions = []
         self._scroll_actions = []  # Track horizontal scroll actions separately
@@ -33,8 +35,9 @@ class EnemyWave(ABC):
         Args:
             speed: New horizontal scroll velocity in pixels per frame
         """
+        velocity = (speed, 0)  # one immutable tuple shared by every action
         for action in self._scroll_actions:
-            action.set_current_velocity((speed, 0))
+            action.set_current_velocity(velocity)
 
     @abstractmethod
     def build(self, ctx: WaveContext) -> arcade.SpriteList:
@@ -0,0 +1,57 @@
+"""Microbenchmarks for per-frame hot paths; record with ``make bench-save``, check with ``make bench-compare``."""
+
+import arcade
+import pytest
+
+from laser_gates import config
+from laser_gates.contexts import WaveContext
+from laser_gates.utils import handle_hill_collision
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _noop(*args):
+    pass
+
+
+@pytest.fixture
+def hill_row(hills):
+    """A screen-wide row of hills along the bottom, like the scrolling hill slices."""
+    for i in range(40):
+        hill = arcade.SpriteSolidColor(32, config.HILL_HEIGHT, color=arcade.color.RED)
+        hill.position = (i * 32 + 16, config.TUNNEL_WALL_HEIGHT + config.HILL_HEIGHT / 2)
+        hills.append(hill)
+    return hills
+
+
+def test_bench_handle_hill_collision_miss(benchmark, hill_row, player):
+    """Typical frame: the player is clear of every hill."""
+    player.position = (200, config.WINDOW_HEIGHT // 2)
+    assert benchmark(handle_hill_collision, player, [hill_row], _noop) is False
+
+
+def test_bench_handle_hill_collision_hit(benchmark, hill_row, player):
+    """Colliding frame: the player is moved back onto the hills before each round."""
+    start = (200, config.TUNNEL_WALL_HEIGHT + config.HILL_HEIGHT)
+
+    def place_on_hills():
+        player.position = start
+
+    result = benchmark.pedantic(
+        handle_hill_collision, args=(player, [hill_row], _noop), setup=place_on_hills, rounds=1000
+    )
+    assert result is True
+
+
+def test_bench_forcefield_update_active(benchmark, player):
+    """Active flashing forcefield with the player over its first bar."""
+    from laser_gates.waves import FlashingForcefieldWave
+
+    wave = FlashingForcefieldWave(total_forcefields=3)
+    ctx = WaveContext(shot_list=arcade.SpriteList(), player_ship=player, register_damage=_noop, on_cleanup=_noop)
+    wave.build(ctx)
+    player.position = wave._bottom_forcefields[0].position
+
+    benchmark(wave.update, ctx)
+
+    wave.cleanup(ctx)
@@ -140,7 +140,7 @@ class TestConfigConstants:
 
     def test_forcefield_colors_defined(self):
         """Test that forcefield colors are properly defined."""
-        assert isinstance(config.FORCEFIELD_SOLID_COLORS, list)
+        assert isinstance(config.FORCEFIELD_SOLID_COLORS, tuple)
         assert len(config.FORCEFIELD_SOLID_COLORS) > 0
 
         # Each color should be a 3-tuple of RGB values
@@ -1,17 +1,13 @@
+from collections import namedtuple
+
 import pytest
 
+from laser_gates import config, logic
 
-class DummyInput:
-    def __init__(self, left=False, right=False, up=False, down=False):
-        self.left = left
-        self.right = right
-        self.up = up
-        self.down = down
+DummyInput = namedtuple("DummyInput", "left right up down", defaults=(False, False, False, False))
 
 
 def test_calculate_player_velocity_moves_right():
-    from laser_gates import config, logic
-
     input_state = DummyInput(right=True)
     # well away from left boundary
     vx, vy = logic.calculate_player_velocity(input_state, current_left_position=config.SHIP_LEFT_BOUND + 50)
@@ -20,8 +16,6 @@ def test_calculate_player_velocity_moves_right():
 
 
 def test_calculate_player_velocity_moves_left_until_left_bound():
-    from laser_gates import config, logic
-
     input_state = DummyInput(left=True)
     # at left boundary -> horizontal should clamp to 0
     vx, vy = logic.calculate_player_velocity(input_state, current_left_position=config.SHIP_LEFT_BOUND)
@@ -30,8 +24,6 @@ def test_calculate_player_velocity_moves_left_until_left_bound():
 
 
 def test_calculate_player_velocity_vertical_moves():
-    from laser_gates import config, logic
-
     input_state = DummyInput(up=True)
     vx, vy = logic.calculate_player_velocity(input_state, current_left_position=config.SHIP_LEFT_BOUND + 1)
     assert vx == 0
@@ -43,9 +35,27 @@ def test_calculate_player_velocity_vertical_moves():
     assert vy == -config.PLAYER_SHIP_VERT
 
 
-def test_calculate_player_velocity_idle_drifts_with_tunnel_velocity():
-    from laser_gates import config, logic
+def test_input_mask_packs_direction_flags():
+    assert logic.input_mask(False, False, False, False) == 0
+    assert logic.input_mask(True, False, False, True) == logic.INPUT_LEFT | logic.INPUT_DOWN
+    assert logic.input_mask(True, True, True, True) == 0b1111
 
+
+@pytest.mark.parametrize("left", [False, True])
+@pytest.mark.parametrize("right", [False, True])
+@pytest.mark.parametrize("up", [False, True])
+@pytest.mark.parametrize("down", [False, True])
+def test_calculate_player_velocity_from_mask_all_key_combinations(left, right, up, down):
+    # Opposing keys cancel out; with no movement at all the ship drifts with the tunnel
+    vx = config.PLAYER_SHIP_HORIZ * (right - left)
+    vy = config.PLAYER_SHIP_VERT * (up - down)
+    expected = (vx, vy) if vx or vy else (config.TUNNEL_VELOCITY, 0)
+
+    mask = logic.input_mask(left, right, up, down)
+    assert logic.calculate_player_velocity_from_mask(mask, config.SHIP_LEFT_BOUND + 10) == expected
+
+
+def test_calculate_player_velocity_idle_drifts_with_tunnel_velocity():
     input_state = DummyInput()
     vx, vy = logic.calculate_player_velocity(input_state, current_left_position=config.SHIP_LEFT_BOUND + 10)
     assert (vx, vy) == (config.TUNNEL_VELOCITY, 0)
@@ -67,8 +77,6 @@ def test_calculate_player_velocity_idle_drifts_with_tunnel_velocity():
 def test_calculate_hill_collision_mtv_axis_choice(
     sprite_cx, sprite_cy, sprite_w, sprite_h, coll_cx, coll_cy, coll_w, coll_h, expected_axis
 ):
-    from laser_gates import logic
-
     overlap, axis = logic.calculate_hill_collision_mtv(
         sprite_cx, sprite_cy, sprite_w, sprite_h, coll_cx, coll_cy, coll_w, coll_h
     )
@@ -76,9 +84,18 @@ def test_calculate_hill_collision_mtv_axis_choice(
     assert overlap > 0
 
 
-def test_get_vertical_push_direction_top_vs_bottom():
-    from laser_gates import config, logic
+def test_calculate_min_vertical_overlap_picks_smallest_positive():
+    # Overlaps against the sprite (cy=50, h=20): 20, 5, and -10 (no overlap)
+    overlap = logic.calculate_min_vertical_overlap(50, 20, [50, 65, 80], [20, 20, 20])
+    assert overlap == 5
+
+
+def test_calculate_min_vertical_overlap_none_when_no_overlap():
+    assert logic.calculate_min_vertical_overlap(50, 20, [100, 0], [10, 10]) is None
+    assert logic.calculate_min_vertical_overlap(50, 20, [], []) is None
+
 
+def test_get_vertical_push_direction_top_vs_bottom():
     # Bottom half -> push up (+1)
     assert logic.get_vertical_push_direction(sprite_center_y=config.WINDOW_HEIGHT / 4) == 1
     # Top half -> push down (-1)
@@ -86,15 +103,11 @@ def test_get_vertical_push_direction_top_vs_bottom():
 
 
 def test_calculate_shot_velocity_by_direction():
-    from laser_gates import config, logic
-
     assert logic.calculate_shot_velocity(direction=1) == config.PLAYER_SHIP_FIRE_SPEED
     assert logic.calculate_shot_velocity(direction=-1) == -config.PLAYER_SHIP_FIRE_SPEED
 
 
 def test_is_shot_off_screen_conditions():
-    from laser_gates import config, logic
-
     # Left of screen
     assert logic.is_shot_off_screen(shot_left=-5, shot_right=-1) is True
     # Right of screen
@@ -104,7 +117,5 @@ def test_is_shot_off_screen_conditions():
 
 
 def test_should_wave_cleanup_on_completion():
-    from laser_gates import logic
-
     assert logic.should_wave_cleanup_on_completion(0) is True
     assert logic.should_wave_cleanup_on_completion(1) is False
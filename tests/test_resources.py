@@ -3,7 +3,7 @@
 import os
 import tempfile
 import unittest
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, PropertyMock, call, patch
 
 import arcade
 from PIL import Image
@@ -98,10 +98,15 @@ class TestSpritePool(unittest.TestCase):
 
     def test_active_uses_spatial_hash(self):
         """Active sprite list should use spatial hash for performance."""
-        # This is tested by verifying the constructor was called correctly
-        # We can't easily inspect the internal state, so we'll verify behavior
-        # Check that the spatial hash was enabled during construction
         self.assertIsInstance(self.pool.active, arcade.SpriteList)
+        self.assertIsNotNone(self.pool.active.spatial_hash)
+
+    def test_active_spatial_hash_can_be_disabled(self):
+        """Pools whose active list is never collided against can skip the spatial hash."""
+        pool = SpritePool(self.mock_sprite_factory, size=2, use_spatial_hash=False)
+
+        self.assertIsNone(pool.active.spatial_hash)
+        self.assertEqual(len(pool.acquire(2)), 2)
 
     def test_acquire_sprites(self):
         """Should move sprites from inactive to active."""
@@ -177,6 +182,34 @@ class TestSpritePool(unittest.TestCase):
         self.assertEqual(len(self.pool.active), 2)  # 4 - 2 released
         self.assertEqual(len(self.pool.inactive), 3)  # 1 + 2 released
 
+    def test_counts_track_acquire_and_release(self):
+        """Counters should match the list lengths through acquire, release and release_all."""
+        self.assertEqual((self.pool.active_count, self.pool.inactive_count), (0, 5))
+
+        sprites = self.pool.acquire(4)
+        self.assertEqual((self.pool.active_count, self.pool.inactive_count), (4, 1))
+
+        self.pool.release(sprites[:1])
+        self.assertEqual((self.pool.active_count, self.pool.inactive_count), (3, 2))
+
+        self.pool.release_all()
+        self.assertEqual((self.pool.active_count, self.pool.inactive_count), (0, 5))
+        self.assertEqual(self.pool.active_count, len(self.pool.active))
+        self.assertEqual(self.pool.inactive_count, len(self.pool.inactive))
+
+    def test_double_release_keeps_counts_and_exhaustion_check(self):
+        """Releasing a sprite twice should not inflate the available count past the real list."""
+        sprite = self.pool.acquire(2)[0]
+        self.pool.release([sprite])
+        self.pool.release([sprite])
+
+        self.assertEqual(self.pool.inactive_count, 4)
+        self.assertEqual(self.pool.inactive_count, len(self.pool.inactive))
+        self.assertEqual(self.pool.active_count, len(self.pool.active))
+        with self.assertRaises(RuntimeError) as cm:
+            self.pool.acquire(5)
+        self.assertIn("pool exhausted", str(cm.exception))
+
     def test_factory_function_type_hint(self):
         """Pool should accept a callable factory function."""
 
@@ -291,48 +324,28 @@ class TestCreateRolledTextures(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up for tests - no window needed for texture manipulation tests."""
+        """Build the shared test texture once - no window needed for texture manipulation tests."""
         # These tests don't actually need a window since they only manipulate
         # texture pixel data, not render anything. Skip window creation to
         # avoid flashing windows and CI issues.
-        cls._window_opened = False
-
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up - nothing to do since no window was opened."""
-        pass
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.test_image_path = os.path.join(cls.temp_dir, "test.png")
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a temporary image file for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_image_path = os.path.join(self.temp_dir, "test.png")
-
-        # Create a simple 4x4 test image with distinct rows
+        # Create a simple 4x4 test image with distinct rows that's easy to verify rolling:
+        # red, green, blue, then white, each row filled with a single paste
         img = Image.new("RGBA", (4, 4), (0, 0, 0, 0))
-        pixels = img.load()
+        row_colors = [(255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 255, 255), (255, 255, 255, 255)]
+        for y, color in enumerate(row_colors):
+            img.paste(color, (0, y, 4, y + 1))
 
-        # Create a pattern that's easy to verify rolling
-        # Row 0: Red pixels
-        for x in range(4):
-            pixels[x, 0] = (255, 0, 0, 255)
-        # Row 1: Green pixels
-        for x in range(4):
-            pixels[x, 1] = (0, 255, 0, 255)
-        # Row 2: Blue pixels
-        for x in range(4):
-            pixels[x, 2] = (0, 0, 255, 255)
-        # Row 3: White pixels
-        for x in range(4):
-            pixels[x, 3] = (255, 255, 255, 255)
+        img.save(cls.test_image_path)
+        cls.base_texture = arcade.load_texture(cls.test_image_path)
 
-        img.save(self.test_image_path)
-        self.base_texture = arcade.load_texture(self.test_image_path)
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        os.remove(self.test_image_path)
-        os.rmdir(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test image."""
+        os.remove(cls.test_image_path)
+        os.rmdir(cls.temp_dir)
 
     def test_basic_functionality(self):
         """Test that the function returns the correct number of textures."""
@@ -357,6 +370,16 @@ class TestCreateRolledTextures(unittest.TestCase):
         result = create_rolled_textures(self.base_texture, num_frames=0)
         self.assertEqual(len(result), 0)
 
+    def test_repeat_call_returns_cached_frames(self):
+        """Test that rolling the same texture twice reuses the first result."""
+        result1 = create_rolled_textures(self.base_texture, num_frames=2)
+
+        with patch.object(type(self.base_texture), "image", new_callable=PropertyMock) as mock_image:
+            result2 = create_rolled_textures(self.base_texture, num_frames=2)
+
+        self.assertIs(result1, result2)
+        mock_image.assert_not_called()
+
     def test_rolling_behavior(self):
         """Test that the textures are actually rolled correctly."""
         result = create_rolled_textures(self.base_texture, num_frames=2)
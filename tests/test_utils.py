@@ -1,10 +1,37 @@
+import functools
+import random
+
 import arcade
+import pytest
 
+from laser_gates import config
+from laser_gates.utils import create_sprite_at_location, create_tunnel_wall, handle_hill_collision
+
+
+@functools.lru_cache(maxsize=16)
+def _solid_texture(width, height):
+    """Solid-color texture for a size, held for the whole session so tests share it."""
+    return arcade.SpriteSolidColor(width, height).texture
+
+
+def make_solid(width, height, color):
+    """Build a solid-color sprite on the shared texture for its size."""
+    sprite = arcade.Sprite(_solid_texture(width, height))
+    sprite.color = color
+    return sprite
+
+
+# Arcade resource, so no local files are required
+COIN_PATH = ":resources:images/items/coinGold.png"
 
-def test_create_tunnel_wall_dimensions_and_position():
-    from laser_gates import config
-    from laser_gates.utils import create_tunnel_wall
 
+@pytest.fixture(scope="session")
+def coin_texture():
+    """Decode the coin image once; sprites built from the shared texture skip the PNG load."""
+    return arcade.load_texture(COIN_PATH)
+
+
+def test_create_tunnel_wall_dimensions_and_position():
     left = 10
     top = config.WINDOW_HEIGHT
     wall = create_tunnel_wall(left, top)
@@ -17,115 +44,131 @@ def test_create_tunnel_wall_dimensions_and_position():
 
 
 def test_create_sprite_at_location_with_left_top():
-    from laser_gates.utils import create_sprite_at_location
-
-    # Use an Arcade resource so no local files are required
-    res_path = ":resources:images/items/coinGold.png"
-    sprite = create_sprite_at_location(res_path, left=100, top=200)
+    # Load from the path string here; the other tests pass the preloaded texture
+    sprite = create_sprite_at_location(COIN_PATH, left=100, top=200)
 
     assert isinstance(sprite, arcade.Sprite)
     assert sprite.left == 100
     assert sprite.top == 200
 
 
-def test_create_sprite_at_location_with_centers():
-    from laser_gates.utils import create_sprite_at_location
-
-    res_path = ":resources:images/items/coinGold.png"
-    sprite = create_sprite_at_location(res_path, center_x=123, center_y=321)
+def test_create_sprite_at_location_with_centers(coin_texture):
+    sprite = create_sprite_at_location(coin_texture, center_x=123, center_y=321)
 
     assert isinstance(sprite, arcade.Sprite)
     assert sprite.center_x == 123
     assert sprite.center_y == 321
 
 
-def test_handle_hill_collision_bottom_half_pushes_up():
-    from laser_gates import config
-    from laser_gates.utils import handle_hill_collision
+@pytest.mark.parametrize(
+    "player_x,player_y,hill_specs,expected_direction",
+    [
+        # Bottom half -> pushed up
+        (100, config.WINDOW_HEIGHT // 4, [(0, 40)], 1),
+        # Top half -> pushed down
+        (150, int(config.WINDOW_HEIGHT * 0.75), [(0, 40)], -1),
+        # Exactly at screen center -> pushed down
+        (100, config.WINDOW_HEIGHT // 2, [(0, 40)], -1),
+        # Two overlapping hills exercise the minimum-overlap search; bottom half -> pushed up
+        (100, config.WINDOW_HEIGHT // 4, [(-2, 30), (2, 25)], 1),
+    ],
+    ids=["bottom_half_pushes_up", "top_half_pushes_down", "exact_screen_center", "multiple_hills"],
+)
+def test_handle_hill_collision_pushes_away_from_center(
+    hills, damage, player, player_x, player_y, hill_specs, expected_direction
+):
+    """Test that an overlapping player is pushed vertically away from the screen center."""
+    player.position = (player_x, player_y)
+
+    # Square hills centered on the player's row, offset horizontally by dx
+    for dx, size in hill_specs:
+        hill = make_solid(size, size, arcade.color.RED)
+        hill.position = (player_x + dx, player_y)
+        hills.append(hill)
+
+    moved = handle_hill_collision(player, [hills], damage.append)
 
-    # Player sprite in bottom half
-    player = arcade.SpriteSolidColor(20, 20, color=arcade.color.WHITE)
-    player.center_x = 100
-    player.center_y = config.WINDOW_HEIGHT // 4
+    assert moved is True
+    assert (player.center_y - player_y) * expected_direction > 0
+    assert player.change_y == 0
+    assert damage == [0.3]
 
-    # Create a "hill" that overlaps vertically with the player
-    hill = arcade.SpriteSolidColor(40, 40, color=arcade.color.RED)
-    hill.center_x = player.center_x
-    hill.center_y = player.center_y  # ensure overlap
 
-    damage = []
+def _brute_force_vertical_overlaps(player, hills):
+    """Vertical overlap of every hill whose AABB intersects the player's."""
+    return [
+        (player.height + hill.height) / 2 - abs(player.center_y - hill.center_y)
+        for hill in hills
+        if abs(player.center_x - hill.center_x) < (player.width + hill.width) / 2
+        and abs(player.center_y - hill.center_y) < (player.height + hill.height) / 2
+    ]
 
-    def register_damage(amount: float):
-        damage.append(amount)
 
-    hills = arcade.SpriteList()
-    hills.append(hill)
-    moved = handle_hill_collision(player, [hills], register_damage)
-    assert moved is True
-    assert player.center_y > config.WINDOW_HEIGHT // 4  # pushed up
-    assert player.change_y == 0
-    assert damage and damage[0] == 0.3
+def test_handle_hill_collision_many_hills_matches_brute_force(hills, damage, player):
+    """Test that the push distance across 100 hills matches a per-hill AABB computation."""
+    rng = random.Random(0)
+    start_x, start_y = 200.0, config.WINDOW_HEIGHT // 4
+    player.position = (start_x, start_y)
 
+    for _ in range(100):
+        size = rng.randint(10, 60)
+        hill = make_solid(size, size, arcade.color.RED)
+        hill.position = (start_x + rng.uniform(-150, 150), start_y + rng.uniform(-60, 60))
+        hills.append(hill)
 
-def test_handle_hill_collision_top_half_pushes_down():
-    from laser_gates import config
-    from laser_gates.utils import handle_hill_collision
+    vertical_overlaps = _brute_force_vertical_overlaps(player, hills)
+    assert vertical_overlaps, "Fixture should produce at least one overlapping hill"
 
-    # Player sprite in top half
-    player = arcade.SpriteSolidColor(20, 20, color=arcade.color.WHITE)
-    player.center_x = 150
-    player.center_y = int(config.WINDOW_HEIGHT * 0.75)
+    moved = handle_hill_collision(player, [hills], damage.append)
 
-    # Overlapping hill
-    hill = arcade.SpriteSolidColor(40, 40, color=arcade.color.BLUE)
-    hill.center_x = player.center_x
-    hill.center_y = player.center_y
+    assert moved is True
+    # Bottom half pushes up by the smallest vertical overlap plus one pixel
+    assert player.center_y - start_y == pytest.approx(min(vertical_overlaps) + 1)
+    assert damage == [0.3]
 
-    damage = []
 
-    def register_damage(amount: float):
-        damage.append(amount)
+@pytest.mark.parametrize("hill_count", [500, 1000])
+@pytest.mark.parametrize("use_spatial_hash", [True, False], ids=["spatial_hash", "brute_force"])
+def test_handle_hill_collision_large_hill_list(damage, player, use_spatial_hash, hill_count):
+    """Test that large hill lists resolve identically with and without the spatial hash fast path."""
+    rng = random.Random(1)
+    hills = arcade.SpriteList(use_spatial_hash=use_spatial_hash)
+    start_x, start_y = 200.0, config.WINDOW_HEIGHT // 4
+    player.position = (start_x, start_y)
 
-    original_y = player.center_y
-    hills = arcade.SpriteList()
-    hills.append(hill)
-    moved = handle_hill_collision(player, [hills], register_damage)
-    assert moved is True
-    assert player.center_y < original_y  # pushed down
-    assert player.change_y == 0
-    assert damage and damage[0] == 0.3
+    # Spread hills well beyond the player so most fall outside its hash cells
+    for _ in range(hill_count):
+        size = rng.randint(10, 60)
+        hill = make_solid(size, size, arcade.color.RED)
+        hill.position = (start_x + rng.uniform(-2000, 2000), start_y + rng.uniform(-40, 40))
+        hills.append(hill)
 
+    vertical_overlaps = _brute_force_vertical_overlaps(player, hills)
+    assert vertical_overlaps, "Fixture should produce at least one overlapping hill"
 
-def test_handle_hill_collision_no_overlap_returns_false():
-    from laser_gates.utils import handle_hill_collision
+    moved = handle_hill_collision(player, [hills], damage.append)
 
-    player = arcade.SpriteSolidColor(20, 20, color=arcade.color.WHITE)
-    player.center_x = 50
-    player.center_y = 50
+    assert moved is True
+    assert player.center_y - start_y == pytest.approx(min(vertical_overlaps) + 1)
+    assert damage == [0.3]
 
-    # Place hill far away so no overlap
-    hill = arcade.SpriteSolidColor(20, 20, color=arcade.color.ALMOND)
-    hill.center_x = 1000
-    hill.center_y = 1000
 
-    damage = []
+def test_handle_hill_collision_no_overlap_returns_false(hills, damage, player):
+    player.position = (50, 50)
 
-    def register_damage(amount: float):
-        damage.append(amount)
+    # Place hill far away so no overlap
+    hill = make_solid(20, 20, arcade.color.ALMOND)
+    hill.position = (1000, 1000)
 
-    hills = arcade.SpriteList()
     hills.append(hill)
-    moved = handle_hill_collision(player, [hills], register_damage)
+    moved = handle_hill_collision(player, [hills], damage.append)
     assert moved is False
     assert damage == []
 
 
-def test_create_sprite_at_location_no_position_params():
+def test_create_sprite_at_location_no_position_params(coin_texture):
     """Test sprite creation without position parameters - sprite stays at default (0, 0)."""
-    from laser_gates.utils import create_sprite_at_location
-
-    res_path = ":resources:images/items/coinGold.png"
-    sprite = create_sprite_at_location(res_path)
+    sprite = create_sprite_at_location(coin_texture)
 
     assert isinstance(sprite, arcade.Sprite)
     # Default position when no positioning params provided
@@ -133,31 +176,20 @@ def test_create_sprite_at_location_no_position_params():
     assert sprite.center_y == 0
 
 
-def test_handle_hill_collision_horizontal_overlap_less_than_vertical():
+def test_handle_hill_collision_horizontal_overlap_less_than_vertical(hills, damage):
     """Test collision when horizontal overlap is smaller than vertical overlap."""
-    from laser_gates import config
-    from laser_gates.utils import handle_hill_collision
-
     # Create player sprite
-    player = arcade.SpriteSolidColor(20, 40, color=arcade.color.WHITE)
-    player.center_x = 100
-    player.center_y = config.WINDOW_HEIGHT // 2
+    player = make_solid(20, 40, arcade.color.WHITE)
+    player.position = (100, config.WINDOW_HEIGHT // 2)
 
     # Create hill with more vertical than horizontal overlap
     # Wider hill to ensure horizontal overlap is smaller
-    hill = arcade.SpriteSolidColor(100, 30, color=arcade.color.RED)
-    hill.center_x = player.center_x + 5  # Small horizontal offset
-    hill.center_y = player.center_y
-
-    damage = []
+    hill = make_solid(100, 30, arcade.color.RED)
+    hill.position = (player.center_x + 5, player.center_y)  # Small horizontal offset
 
-    def register_damage(amount: float):
-        damage.append(amount)
-
-    hills = arcade.SpriteList()
     hills.append(hill)
     original_y = player.center_y
-    moved = handle_hill_collision(player, [hills], register_damage)
+    moved = handle_hill_collision(player, [hills], damage.append)
 
     assert moved is True
     # Should be pushed vertically since player is at screen center
@@ -166,95 +198,18 @@ def test_handle_hill_collision_horizontal_overlap_less_than_vertical():
     assert len(damage) == 1
 
 
-def test_handle_hill_collision_multiple_hills():
-    """Test collision with multiple hills to exercise minimum overlap logic."""
-    from laser_gates import config
-    from laser_gates.utils import handle_hill_collision
-
-    player = arcade.SpriteSolidColor(20, 20, color=arcade.color.WHITE)
-    player.center_x = 100
-    player.center_y = config.WINDOW_HEIGHT // 4
-
-    # Create two hills at different positions, both overlapping
-    hill1 = arcade.SpriteSolidColor(30, 30, color=arcade.color.RED)
-    hill1.center_x = player.center_x - 2
-    hill1.center_y = player.center_y
-
-    hill2 = arcade.SpriteSolidColor(25, 25, color=arcade.color.BLUE)
-    hill2.center_x = player.center_x + 2
-    hill2.center_y = player.center_y
-
-    damage = []
-
-    def register_damage(amount: float):
-        damage.append(amount)
-
-    hills = arcade.SpriteList()
-    hills.append(hill1)
-    hills.append(hill2)
-
-    original_y = player.center_y
-    moved = handle_hill_collision(player, [hills], register_damage)
-
-    assert moved is True
-    # Should be pushed up (in bottom half)
-    assert player.center_y > original_y
-    assert player.change_y == 0
-    assert damage == [0.3]
-
-
-def test_handle_hill_collision_exact_screen_center():
-    """Test collision when player is exactly at screen center."""
-    from laser_gates import config
-    from laser_gates.utils import handle_hill_collision
-
-    player = arcade.SpriteSolidColor(20, 20, color=arcade.color.WHITE)
-    player.center_x = 100
-    player.center_y = config.WINDOW_HEIGHT // 2  # Exactly at center
-
-    hill = arcade.SpriteSolidColor(40, 40, color=arcade.color.RED)
-    hill.center_x = player.center_x
-    hill.center_y = player.center_y
-
-    damage = []
-
-    def register_damage(amount: float):
-        damage.append(amount)
-
-    hills = arcade.SpriteList()
-    hills.append(hill)
-
-    moved = handle_hill_collision(player, [hills], register_damage)
-
-    assert moved is True
-    # At exact center, should push down (vertical_dir = -1)
-    assert player.center_y != config.WINDOW_HEIGHT // 2
-    assert player.change_y == 0
-    assert damage == [0.3]
-
-
-def test_handle_hill_collision_negative_overlap_edge_case():
+def test_handle_hill_collision_negative_overlap_edge_case(hills, damage):
     """Test edge case where overlap calculation might be negative or zero."""
-    from laser_gates.utils import handle_hill_collision
-
-    player = arcade.SpriteSolidColor(10, 10, color=arcade.color.WHITE)
-    player.center_x = 100
-    player.center_y = 100
+    player = make_solid(10, 10, arcade.color.WHITE)
+    player.position = (100, 100)
 
     # Create hill that's barely touching (edge case)
-    hill = arcade.SpriteSolidColor(10, 10, color=arcade.color.RED)
-    hill.center_x = player.center_x + 9.9  # Almost not overlapping
-    hill.center_y = player.center_y
-
-    damage = []
-
-    def register_damage(amount: float):
-        damage.append(amount)
+    hill = make_solid(10, 10, arcade.color.RED)
+    hill.position = (player.center_x + 9.9, player.center_y)  # Almost not overlapping
 
-    hills = arcade.SpriteList()
     hills.append(hill)
 
     # This might or might not collide depending on exact floating point
-    result = handle_hill_collision(player, [hills], register_damage)
+    result = handle_hill_collision(player, [hills], damage.append)
     # Just verify it doesn't crash and returns a boolean
     assert isinstance(result, bool)